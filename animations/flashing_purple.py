@@ -1,8 +1,10 @@
 import asyncio
 import time
+from animations.utils import SENSOR_POLL_EVERY
 from utils import SharedState
 from shape import Shape
 
+
 async def animate(
         shape: Shape,
         stop_event: asyncio.Event,
@@ -18,12 +20,20 @@ async def animate(
     # Framerate tracking variables
     total_frames = 0
     start_time = time.time()
-    
+
+    distances = None
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     async def process_animation_step(step_index):
-        nonlocal total_frames
+        nonlocal total_frames, distances, frames_since_poll
         frame_start = time.time_ns()
-        
-        distances = (await state.get()).get("distances")
+
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            # Live flat (distance, temp) array; no snapshot needed since
+            # read_sensor overwrites it in place
+            distances = state.get_unsafe().get("distances")
+            frames_since_poll = 0
         
         # First pass - set base colors
         for j in range(len(shape.layers)):
@@ -31,7 +41,7 @@ async def animate(
             distance = int(abs(step_index - layer_location))
             intensity = max(minimum_intensity, 255 - distance*30)
             for face in shape.layers[j]:
-                sensor_temp = max([distances[i][1] for i in shape.face_to_sensors[face]] + [0])
+                sensor_temp = max([distances[2 * i + 1] for i in shape.face_to_sensors[face]] + [0]) if distances else 0
                 face_color = (intensity, 0, int(intensity*((255-sensor_temp)/255)))
                 shape.set_face_color(face, face_color)
         
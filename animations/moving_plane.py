@@ -2,7 +2,7 @@ import asyncio
 import time
 import math
 import random
-from animations.utils import get_all_colors
+from animations.utils import SENSOR_POLL_EVERY, get_all_colors
 from utils import SharedState
 from read_sensor import TempratureSettings
 from shape import Shape
@@ -96,6 +96,9 @@ async def animate(
     # Animation loop
     last_frame_time = time.ticks_ms()
     last_debug_print = last_frame_time
+
+    sensor_data = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
     
     while not stop_event.is_set():
         frame_start = time.ticks_ms()
@@ -139,7 +142,10 @@ async def animate(
                 print(f"\nPlane reversed direction! New position: ({plane_point[0]:.2f}, {plane_point[1]:.2f}, {plane_point[2]:.2f})")
         
         # Get sensor data
-        sensor_data = (await state.get()).get("distances", [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            sensor_data = state.get_unsafe().get("distances", [])
+            frames_since_poll = 0
         
         # Start timing the calculation phase
         calc_start = time.ticks_ms()
@@ -155,14 +161,13 @@ async def animate(
             # Interpolate between foreground and background based on distance
             color_by_plane = interpolate_colors(foreground_color, background_color, dist)
             
-            # Get maximum temperature for this face
+            # Get maximum temperature for this face, skipping the per-sensor
+            # validation loop when there is no sensor data (the common idle case)
             max_temp = 0
-            if face_idx < len(shape.face_to_sensors):
+            if sensor_data and face_idx < len(shape.face_to_sensors):
                 for sensor_idx in shape.face_to_sensors[face_idx]:
-                    if (sensor_idx < len(sensor_data) and 
-                        sensor_data[sensor_idx] is not None and 
-                        sensor_data[sensor_idx][1] is not None):
-                        max_temp = max(max_temp, sensor_data[sensor_idx][1])
+                    if 2 * sensor_idx + 1 < len(sensor_data):
+                        max_temp = max(max_temp, sensor_data[2 * sensor_idx + 1])
             
             # Normalize temperature to 0-1 range
             temp_factor = max_temp / 255.0
@@ -179,9 +184,6 @@ async def animate(
         # Calculate how long the processing took
         calc_time = time.ticks_diff(time.ticks_ms(), calc_start)
         
-        # Calculate remaining time in the frame after processing
-        remaining_frame_time = FRAME_TIME_MS - calc_time
-        
-        # Only sleep if we have time remaining
-        if remaining_frame_time > 0:
-            await asyncio.sleep_ms(remaining_frame_time) 
\ No newline at end of file
+        # Sleep out the rest of the frame; sleep_ms(0) still yields so other
+        # tasks run even when the frame overruns
+        await asyncio.sleep_ms(max(0, FRAME_TIME_MS - calc_time)) 
\ No newline at end of file
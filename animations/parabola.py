@@ -2,6 +2,7 @@ import asyncio
 import math
 import random
 import utime
+from animations.utils import SENSOR_POLL_EVERY
 from utils import SharedState
 from shape import Shape
 
@@ -54,9 +55,15 @@ async def animate(
     x, z, y = 0.0, 0.0, 0.5
     vx, vz = INITIAL_VX, INITIAL_VZ
 
+    distances = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     while not stop_event.is_set():
         frame_start = utime.ticks_ms()
-        distances = (await state.get()).get('distances', [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            distances = state.get_unsafe().get('distances', [])
+            frames_since_poll = 0
 
         # Update ball physics
         x, z, y, vx, vz = step(x, z, y, vx, vz)
@@ -78,14 +85,10 @@ async def animate(
             color[ball_channel] = int(255 * (1 - distance))
 
             # Process sensor data for this face
-            if face_id < len(shape.face_to_sensors) and shape.face_to_sensors[face_id]:
+            if distances and face_id < len(shape.face_to_sensors) and len(shape.face_to_sensors[face_id]):
                 # Get maximum sensor value for this face
                 sensor_values = [
-                    distances[sensor][1] if (
-                        sensor < len(distances) and 
-                        distances[sensor] is not None and 
-                        distances[sensor][1] is not None
-                    ) else 0
+                    distances[2 * sensor + 1] if 2 * sensor + 1 < len(distances) else 0
                     for sensor in shape.face_to_sensors[face_id]
                 ]
                 max_sensor = max(sensor_values) if sensor_values else 0
@@ -114,6 +117,5 @@ async def animate(
 
         # Frame timing
         frame_duration = utime.ticks_diff(utime.ticks_ms(), frame_start)
-        if frame_duration < FRAME_TIME_MS:
-            await asyncio.sleep_ms(FRAME_TIME_MS - frame_duration)
+        await asyncio.sleep_ms(max(0, FRAME_TIME_MS - frame_duration))
 
@@ -1,6 +1,7 @@
 import asyncio
 import time
 import math
+from animations.utils import SENSOR_POLL_EVERY
 from utils import SharedState
 from shape import Shape
 
@@ -62,7 +63,10 @@ async def animate(
     
     # Animation loop timing
     last_frame_time = time.ticks_ms()
-    
+
+    sensor_readings = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     while not stop_event.is_set():
         frame_start_ms = time.ticks_ms()
         
@@ -71,7 +75,10 @@ async def animate(
         last_frame_time = frame_start_ms
         
         # Get sensor data
-        sensor_readings_tuples = (await state.get()).get("distances", [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            sensor_readings = state.get_unsafe().get("distances", [])
+            frames_since_poll = 0
         
         # Logic for sweeping base rainbow colors across layers/faces
         if time.ticks_diff(frame_start_ms, last_color_sweep_time_ms) > COLOR_CHANGE_INTERVAL:
@@ -100,12 +107,12 @@ async def animate(
                 
                 # Get maximum temperature from sensors for this face
                 face_temp = 0
-                if actual_face_idx < len(shape.face_to_sensors):
+                # Skip the per-sensor validation loop entirely when there is
+                # no sensor data (the common idle case)
+                if sensor_readings and actual_face_idx < len(shape.face_to_sensors):
                     for sensor_idx in shape.face_to_sensors[actual_face_idx]:
-                        if (sensor_idx < len(sensor_readings_tuples) and 
-                            sensor_readings_tuples[sensor_idx] is not None and
-                            sensor_readings_tuples[sensor_idx][1] is not None):
-                            face_temp = max(face_temp, sensor_readings_tuples[sensor_idx][1])
+                        if 2 * sensor_idx + 1 < len(sensor_readings):
+                            face_temp = max(face_temp, sensor_readings[2 * sensor_idx + 1])
                 
                 # Update face frequency based on temperature
                 pulse_active = False
@@ -175,7 +182,6 @@ async def animate(
         
         # Frame timing
         frame_duration = time.ticks_diff(time.ticks_ms(), frame_start_ms)
-        if frame_duration < FRAME_TIME:
-            await asyncio.sleep_ms(FRAME_TIME - frame_duration)
+        await asyncio.sleep_ms(max(0, FRAME_TIME - frame_duration))
             
 
@@ -2,7 +2,7 @@ import asyncio
 import time
 import math
 import random
-from animations.utils import get_all_colors
+from animations.utils import SENSOR_POLL_EVERY, get_all_colors
 from utils import SharedState
 from read_sensor import TempratureSettings
 from shape import Shape
@@ -139,13 +139,19 @@ async def animate(
     # Animation timing variables
     last_frame_time = time.ticks_ms()
     frame_count = 0
-    
+
+    sensor_data = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     while not stop_event.is_set():
         frame_start = time.ticks_ms()
         frame_count += 1
-        
+
         # Get sensor data
-        sensor_data = (await state.get()).get("distances", [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            sensor_data = state.get_unsafe().get("distances", [])
+            frames_since_poll = 0
         
         # Update phases
         dt = time.ticks_diff(frame_start, last_frame_time) / 1000.0  # Convert to seconds
@@ -178,14 +184,15 @@ async def animate(
             # Decay current ripple intensity
             ripple.intensities[face_idx] *= RIPPLE_DECAY_RATE
             
-            # Check sensors for this face
-            if face_idx < len(shape.face_to_sensors):
+            # Check sensors for this face, skipping the validation loop
+            # entirely when there is no sensor data (the common idle case)
+            if sensor_data and face_idx < len(shape.face_to_sensors):
                 max_temp = 0
                 active_sensors = []
                 for sensor_idx in shape.face_to_sensors[face_idx]:
-                    if sensor_idx < len(sensor_data) and sensor_data[sensor_idx] is not None:
-                        temp = sensor_data[sensor_idx][1]  # Get temperature value
-                        if temp is not None and temp > max_temp:
+                    if 2 * sensor_idx + 1 < len(sensor_data):
+                        temp = sensor_data[2 * sensor_idx + 1]  # Get temperature value
+                        if temp > max_temp:
                             max_temp = temp
                             active_sensors.append((sensor_idx, temp))
                 
@@ -245,5 +252,4 @@ async def animate(
         
         # Frame timing
         frame_duration = time.ticks_diff(time.ticks_ms(), frame_start)
-        if frame_duration < FRAME_TIME_MS:
-            await asyncio.sleep_ms(FRAME_TIME_MS - frame_duration) 
\ No newline at end of file
+        await asyncio.sleep_ms(max(0, FRAME_TIME_MS - frame_duration))
\ No newline at end of file
@@ -2,7 +2,7 @@ import asyncio
 import math
 import random
 import time
-from animations.utils import get_all_colors
+from animations.utils import SENSOR_POLL_EVERY, get_all_colors
 from utils import SharedState
 from shape import Shape
 
@@ -107,12 +107,18 @@ async def animate(
     face_colors = [(0, 0, 0)] * shape.num_faces
     face_target_colors = [(0, 0, 0)] * shape.num_faces
     color_transition_factors = [0.0] * shape.num_faces
-    
+
+    sensor_data = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     while not stop_event.is_set():
         frame_start = time.ticks_ms()
-        
+
         # Get sensor data
-        sensor_data = (await state.get()).get("distances", [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            sensor_data = state.get_unsafe().get("distances", [])
+            frames_since_poll = 0
         
         # Update orb physics
         orb_x, orb_z_vertical, vx_orb, vz_orb_vertical = step_orb_motion(
@@ -151,14 +157,14 @@ async def animate(
             # Get sensor data for this face
             max_temp = 0
             min_sensor_dist = MAX_SENSOR_DISTANCE_MM
-            if face_idx < len(shape.face_to_sensors):
+            # Skip the per-sensor validation loop entirely when there is no
+            # sensor data (the common idle case)
+            if sensor_data and face_idx < len(shape.face_to_sensors):
                 for sensor_idx in shape.face_to_sensors[face_idx]:
-                    if (sensor_idx < len(sensor_data) and 
-                        sensor_data[sensor_idx] is not None):
-                        sensor_dist, sensor_temp = sensor_data[sensor_idx]
-                        if sensor_temp is not None:
-                            max_temp = max(max_temp, sensor_temp)
-                        if sensor_dist is not None:
+                    if 2 * sensor_idx + 1 < len(sensor_data):
+                        sensor_dist = sensor_data[2 * sensor_idx]
+                        max_temp = max(max_temp, sensor_data[2 * sensor_idx + 1])
+                        if sensor_dist >= 0:  # -1 means no reading
                             min_sensor_dist = min(min_sensor_dist, sensor_dist)
             
             # Update pulse frequency based on closest sensor distance
@@ -210,5 +216,4 @@ async def animate(
         
         # Frame timing
         frame_duration = time.ticks_diff(time.ticks_ms(), frame_start)
-        if frame_duration < FRAME_TIME_MS:
-            await asyncio.sleep_ms(FRAME_TIME_MS - frame_duration) 
\ No newline at end of file
+        await asyncio.sleep_ms(max(0, FRAME_TIME_MS - frame_duration)) 
\ No newline at end of file
@@ -1,11 +1,13 @@
 # animations/spinning_slice.py
 
+import array
 import asyncio
 import time
 import math
 import random
 from shape import Shape
 import neopixel
+from animations.utils import SENSOR_POLL_EVERY
 from utils import SharedState
 
 # --- Vector Math Helpers (same as before) ---
@@ -53,7 +55,13 @@ async def animate(
     """
     Main animation function with palettes and speed control.
     """
-    face_centers = [[p[0] - 0.5, p[1] - 0.5, p[2] - 0.5] for p in shape.face_positions]
+    # Flat float32 array of centered face positions (x, y, z per face).
+    # One packed buffer instead of a list of 3-float lists keeps the per-face
+    # reads in the hot loop as cheap indexed loads.
+    num_faces = shape.num_faces
+    face_centers = array.array('f')
+    for p in shape.face_positions:
+        face_centers.extend((p[0] - 0.5, p[1] - 0.5, p[2] - 0.5))
     last_revolution_colors = {}
 
     # --- Setup Palettes ---
@@ -67,11 +75,15 @@ async def animate(
     base_color = colors[0]
     slice_color = colors[current_color_index]
 
+    sensor_data = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
+
     while not stop_event.is_set():
         # --- Setup for new cycle ---
         num_revolutions_target = random.randint(5, 10)
         print(f"Running for {num_revolutions_target} revolutions with slice color {slice_color}")
-        chosen_face_center = random.choice(face_centers)
+        chosen_i3 = random.randint(0, num_faces - 1) * 3
+        chosen_face_center = [face_centers[chosen_i3], face_centers[chosen_i3 + 1], face_centers[chosen_i3 + 2]]
         axis = normalize(chosen_face_center)
         if all(a == 0 for a in axis): axis = [0.0, 0.0, 1.0]
 
@@ -93,11 +105,14 @@ async def animate(
             if stop_event.is_set(): return
             frame_start_ns = time.time_ns()
 
-            sensor_data = (await state.get()).get("distances", [])
+            frames_since_poll += 1
+            if frames_since_poll >= SENSOR_POLL_EVERY:
+                sensor_data = state.get_unsafe().get("distances", [])
+                frames_since_poll = 0
             max_temp = 0
             if sensor_data:
-                valid_temps = [temp for _, temp in sensor_data if temp is not None]
-                if valid_temps: max_temp = max(valid_temps)
+                for i in range(1, len(sensor_data), 2):
+                    if sensor_data[i] > max_temp: max_temp = sensor_data[i]
             speed_factor = calculate_speed_factor(max_temp)
 
             angle_change = BASE_ANGLE_PER_FRAME * speed_factor
@@ -109,19 +124,21 @@ async def animate(
             is_last_rev = current_rev_abs >= (num_revolutions_target - 1)
 
             slice_end_angle = display_angle
-            slice_start_angle = (slice_end_angle - SLICE_WIDTH_RADIANS + TWO_PI) % TWO_PI
 
-            for face_id, p_center in enumerate(face_centers):
-                p_v = dot(p_center, v)
-                p_w = dot(p_center, w)
+            for face_id in range(num_faces):
+                i3 = face_id * 3
+                px = face_centers[i3]
+                py = face_centers[i3 + 1]
+                pz = face_centers[i3 + 2]
+                p_v = px * v[0] + py * v[1] + pz * v[2]
+                p_w = px * w[0] + py * w[1] + pz * w[2]
                 p_angle = math.atan2(p_w, p_v)
-                if p_angle < 0: p_angle += TWO_PI
 
-                in_slice = False
-                if slice_start_angle < slice_end_angle:
-                    if slice_start_angle <= p_angle <= slice_end_angle: in_slice = True
-                else:
-                    if slice_start_angle <= p_angle or p_angle <= slice_end_angle: in_slice = True
+                # Branchless wrap-around test: the face is inside the slice iff
+                # the angular distance back from the slice's trailing edge is at
+                # most the slice width. The modulo also normalizes negative
+                # atan2 results, so no separate wrap handling is needed.
+                in_slice = (slice_end_angle - p_angle) % TWO_PI <= SLICE_WIDTH_RADIANS
 
                 if face_id in last_revolution_colors:
                     shape.set_face_color(face_id, last_revolution_colors[face_id])
@@ -1,8 +1,9 @@
+import array
 import asyncio
 import time
 import math
 from utils import SharedState
-from animations.utils import get_all_colors
+from animations.utils import SENSOR_POLL_EVERY, get_all_colors
 from shape import Shape
 
 FRAME_TIME_MS = int(1000/20)
@@ -49,19 +50,27 @@ async def animate(
     face_colors = [(0, 0, 0)] * shape.num_faces
     face_target_colors = [(0, 0, 0)] * shape.num_faces
     color_transition_progress = [1.0] * shape.num_faces
-    face_temperature_factors = [0.0] * shape.num_faces
-    face_swirl_offsets = [0.0] * shape.num_faces
-    
-    # Calculate initial swirl offsets based on face positions
-    for face_idx in range(shape.num_faces):
-        face_pos = shape.face_positions[face_idx]
-        # Calculate angle in XZ plane
-        angle = math.atan2(face_pos[2], face_pos[0])
-        face_swirl_offsets[face_idx] = angle / (2 * math.pi)
+    # Smoothed temperature factors and their targets, packed as float32 so
+    # the per-frame exponential smoothing is one in-place pass.
+    face_temperature_factors = array.array('f', bytes(4 * shape.num_faces))
+    face_temp_targets = array.array('f', bytes(4 * shape.num_faces))
+    # Last color actually pushed to the LED buffer per face, so unchanged
+    # faces skip the per-LED stores once their transition has settled.
+    prev_face_colors = [None] * shape.num_faces
+
+    # Per-face swirl phase offsets in radians (angle in the XZ plane), packed
+    # as float32 so the per-frame sin pass runs over a contiguous buffer.
+    face_swirl_offsets = array.array('f', (
+        math.atan2(face_pos[2], face_pos[0]) for face_pos in shape.face_positions
+    ))
+    face_swirl_factors = array.array('f', bytes(4 * shape.num_faces))
     
     # Animation timing
     last_frame_time = time.ticks_ms()
     last_color_change = last_frame_time
+
+    sensor_data = []
+    frames_since_poll = SENSOR_POLL_EVERY  # force a poll on the first frame
     
     while not stop_event.is_set():
         frame_start = time.ticks_ms()
@@ -86,27 +95,38 @@ async def animate(
             time_since_last_change = 0
         
         # Get sensor data
-        sensor_data = (await state.get()).get('distances', [])
+        frames_since_poll += 1
+        if frames_since_poll >= SENSOR_POLL_EVERY:
+            sensor_data = state.get_unsafe().get('distances', [])
+            frames_since_poll = 0
+
+            # Per-face temperature targets only change with fresh sensor data,
+            # so refresh them here rather than in the per-frame face loop.
+            # With no sensor data at all (the common idle case) skip the
+            # per-sensor validation entirely and zero the targets.
+            for face_idx in range(shape.num_faces):
+                max_temp = 0
+                if sensor_data and face_idx < len(shape.face_to_sensors):
+                    for sensor_idx in shape.face_to_sensors[face_idx]:
+                        if 2 * sensor_idx + 1 < len(sensor_data):
+                            max_temp = max(max_temp, sensor_data[2 * sensor_idx + 1])
+                face_temp_targets[face_idx] = (max_temp / MAX_SENSOR_TEMP_VALUE) * TEMPERATURE_SENSITIVITY
         
+        # Compute this frame's swirl factors for all faces in one tight pass
+        # (normalized to 0-1), with sin bound to a local.
+        sin = math.sin
+        for face_idx in range(shape.num_faces):
+            face_swirl_factors[face_idx] = 0.5 + 0.5 * sin(swirl_phase + face_swirl_offsets[face_idx])
+
+        # Smooth the temperature factors toward their targets in one in-place
+        # pass over the packed array
+        for face_idx in range(shape.num_faces):
+            face_temperature_factors[face_idx] += (face_temp_targets[face_idx] - face_temperature_factors[face_idx]) * 0.1
+
         # Update each face
         for face_idx in range(shape.num_faces):
-            # Calculate swirl factor for this face
-            swirl_factor = math.sin(swirl_phase + face_swirl_offsets[face_idx] * 2 * math.pi)
-            swirl_factor = (swirl_factor + 1) / 2  # Normalize to 0-1
-            
-            # Get maximum temperature from sensors for this face
-            max_temp = 0
-            if face_idx < len(shape.face_to_sensors):
-                for sensor_idx in shape.face_to_sensors[face_idx]:
-                    if (sensor_idx < len(sensor_data) and 
-                        sensor_data[sensor_idx] is not None and 
-                        sensor_data[sensor_idx][1] is not None):
-                        max_temp = max(max_temp, sensor_data[sensor_idx][1])
-            
-            # Smooth temperature factor transitions
-            target_temp_factor = (max_temp / MAX_SENSOR_TEMP_VALUE) * TEMPERATURE_SENSITIVITY
-            face_temperature_factors[face_idx] += (target_temp_factor - face_temperature_factors[face_idx]) * 0.1
-            
+            swirl_factor = face_swirl_factors[face_idx]
+
             # Calculate base color transition progress
             color_transition_factor = time_since_last_change / BASE_CHANGE_COLOR_TIME_MS
             
@@ -153,13 +173,14 @@ async def animate(
                     color_transition_progress[face_idx]
                 )
             
-            # Set the face color
-            shape.set_face_color(face_idx, final_color)
-        
+            # Set the face color, skipping the buffer write when unchanged
+            if prev_face_colors[face_idx] != final_color:
+                shape.set_face_color(face_idx, final_color)
+                prev_face_colors[face_idx] = final_color
+
         # Update LEDs
         shape.write()
         
         # Frame timing
         frame_duration = time.ticks_diff(time.ticks_ms(), frame_start)
-        if frame_duration < FRAME_TIME_MS:
-            await asyncio.sleep_ms(FRAME_TIME_MS - frame_duration)
+        await asyncio.sleep_ms(max(0, FRAME_TIME_MS - frame_duration))
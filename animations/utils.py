@@ -1,15 +1,20 @@
 from typing import Tuple
 
+# Sensors update much slower than the frame rate, so the shared state is
+# polled every N frames; readings lag by at most N-1 frames.
+SENSOR_POLL_EVERY = 3
+
+_POSSIBLE_VALUES = (0, 127, 255)
+# Pure function of the constants above, so built once at import
+_ALL_COLORS = tuple(
+    (r, g, b)
+    for r in _POSSIBLE_VALUES
+    for g in _POSSIBLE_VALUES
+    for b in _POSSIBLE_VALUES
+    if (not r == g == b) and (r == 0 or g == 0 or b == 0)
+)
+
+
 def get_all_colors() -> list[tuple[int, int, int]]:
-    possible_values = [0,127, 255]
-    colors = []
-
-    colors = [
-        (r, g, b)
-        for r in possible_values
-        for g in possible_values
-        for b in possible_values
-        if (not r == g == b) and (r == 0 or g == 0 or b == 0)
-    ]
-
-    return colors
+    # Fresh list per call since callers shuffle/pop it in place
+    return list(_ALL_COLORS)
@@ -11,6 +11,7 @@ mpremote connect "$PORT" cp utils.py :utils.py
 mpremote connect "$PORT" cp wifi_client.py :wifi_client.py
 mpremote connect "$PORT" cp read_sensor.py :read_sensor.py
 mpremote connect "$PORT" cp VL53L0X.py :VL53L0X.py
+mpremote connect "$PORT" cp rmt_neopixel.py :rmt_neopixel.py
 mpremote connect "$PORT" cp shape.py :shape.py
 mpremote connect "$PORT" cp main.py :main.py
 mpremote connect "$PORT" reset
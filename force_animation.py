@@ -2,6 +2,7 @@
 
 import argparse
 import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -64,76 +65,56 @@ def main():
 
     port = os.environ.get('PORT', '/dev/cu.usbserial-210')
     force_file_on_esp = ":force_animation.txt"
-    local_force_file_name = "force_animation.txt" # Temporary local file
-
-    operation_done = False
 
+    # mpremote supports chaining commands with '+', so the file operation and
+    # the reset share one connection instead of paying the USB enumeration
+    # and interpreter startup cost per command.
     if args.remove:
         if args.animation_name:
             print("Warning: Animation name was provided with --remove flag. It will be ignored.")
-        
-        remove_cmd = f"mpremote connect {port} fs rm {force_file_on_esp}"
-        print(f"Attempting to remove '{force_file_on_esp}' from ESP32...")
-        print(f"Executing: {remove_cmd}")
-        status = os.system(remove_cmd)
-        
+
+        remove_cmd = ["mpremote", "connect", port, "fs", "rm", force_file_on_esp, "+", "reset"]
+        print(f"Attempting to remove '{force_file_on_esp}' from ESP32 and reset...")
+        print(f"Executing: {' '.join(remove_cmd)}")
+        status = subprocess.run(remove_cmd, check=False).returncode
+
         if status == 0:
-            print(f"Successfully removed '{force_file_on_esp}' from ESP32.")
-            operation_done = True
+            print(f"Successfully removed '{force_file_on_esp}' from ESP32 and sent reset.")
         else:
             # mpremote fs rm might return non-zero (e.g., 1) if file doesn't exist.
             # This is not necessarily a critical error for a remove operation.
             print(f"Command to remove '{force_file_on_esp}' finished. mpremote exit code: {status}.")
             print(f"This might mean the file was not found on the ESP32, which is okay for a remove operation.")
-            # We consider removal "done" even if file wasn't there, to proceed to reset.
-            operation_done = True 
+            print("Note: the chained reset may not have run; reset manually if needed.")
 
     elif args.animation_name:
         animation_name = args.animation_name
-        
+
         print(f"Validating animation '{animation_name}'...")
         if not check_animation_exists(animation_name):
             sys.exit(1)
         print(f"Validation successful for animation '{animation_name}'.")
-            
-        local_force_file_path = Path(local_force_file_name)
-        try:
-            print(f"Creating local '{local_force_file_path}' with animation '{animation_name}'.")
-            with open(local_force_file_path, 'w') as f:
-                f.write(animation_name)
-
-            copy_cmd = f"mpremote connect {port} fs cp {local_force_file_path} {force_file_on_esp}"
-            print(f"Attempting to copy '{local_force_file_path}' to '{force_file_on_esp}' on ESP32...")
-            print(f"Executing: {copy_cmd}")
-            status = os.system(copy_cmd)
 
-            if status != 0:
-                print(f"ERROR: Failed to copy '{local_force_file_path}' to '{force_file_on_esp}' on ESP32.")
-                print(f"mpremote exit code: {status}")
-                sys.exit(1) 
-            print(f"Successfully copied '{animation_name}' to '{force_file_on_esp}' on ESP32.")
-            operation_done = True
+        # Write the file directly on the device via mpremote exec — no local
+        # temporary file to create, copy, and clean up, and no stale
+        # force_animation.txt left in the working directory if interrupted.
+        # Close explicitly before the chained reset: MicroPython doesn't
+        # finalize dropped file objects, so an unclosed write could be lost.
+        exec_stmt = f"f = open('force_animation.txt', 'w'); f.write({animation_name!r}); f.close()"
+        write_cmd = ["mpremote", "connect", port, "exec", exec_stmt, "+", "reset"]
+        print(f"Attempting to write '{animation_name}' to '{force_file_on_esp}' on ESP32 and reset...")
+        print(f"Executing: {' '.join(write_cmd)}")
+        status = subprocess.run(write_cmd, check=False).returncode
 
-        finally:
-            if local_force_file_path.exists():
-                os.remove(local_force_file_path)
-                print(f"Removed local temporary file '{local_force_file_path}'.")
+        if status != 0:
+            print(f"ERROR: Failed to write '{force_file_on_esp}' on ESP32.")
+            print(f"mpremote exit code: {status}")
+            sys.exit(1)
+        print(f"Successfully wrote '{animation_name}' to '{force_file_on_esp}' on ESP32 and sent reset.")
     else:
         parser.print_help()
         print("\nERROR: You must provide an animation name or use the --remove flag.")
         sys.exit(1)
 
-    if operation_done:
-        reset_cmd = f"mpremote connect {port} reset"
-        print(f"Attempting to reset ESP32...")
-        print(f"Executing: {reset_cmd}")
-        status = os.system(reset_cmd)
-        if status != 0:
-            print(f"Warning: Failed to reset ESP32. mpremote exit code: {status}")
-        else:
-            print("ESP32 reset command sent successfully.")
-    else:
-        print("No operation was performed that requires an ESP32 reset.")
-
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -1,14 +1,9 @@
 import machine, neopixel
 import time
 import asyncio
-from typing import TypeVar, Generic, Callable, Optional, Dict, Any, TYPE_CHECKING
-from copy import deepcopy
+from array import array
 import sys
 
-if TYPE_CHECKING:
-    from types import ModuleType
-
-from pathlib import Path
 from utils import SharedState
 from wifi_client import connect_to_wifi, fetch_animation_data, is_wifi_connected
 from animations import ANIMATIONS
@@ -16,32 +11,18 @@ from read_sensor import read_sensor, TempratureSettings
 from shape import Shape
 
 
-def get_shape(file_path: Path) -> tuple[int, int, tuple[tuple[int, ...], ...]]:
-    data = json.loads(file_path.read_text())
-    
-    leds_per_face = data.get('led_per_face')
-    faces_data = data.get('faces')
-    sensors = data.get('sensors')
-    sensors_to_face = [[face for face in range(len(faces_data)) if i in faces_data[face]['sensors']] for i in range(sensors)]
-    face_to_sensors = [face['sensors'] for face in faces_data]
-    face_positions = [face['pos'] for face in faces_data]
-
-    if leds_per_face is None or faces_data is None:
-        raise ValueError(f"Invalid shape data in {file_path}")
-
-    num_faces = len(faces_data)
-    layers_map = get_layers(faces_data)
-    return leds_per_face, num_faces, layers_map, sensors_to_face, face_to_sensors, face_positions
-
+# Fixed colors for the boot/error blink sequences, pre-built so the loops
+# don't rebuild list/tuple objects per iteration. These feed straight into
+# the Shape's per-color pattern cache.
+INIT_COLORS = ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+ERROR_COLOR = (255, 0, 0)
+OFF_COLOR = (0, 0, 0)
 
-def set_face_color(np, leds_per_face, face_index, color):
-    face_offset = leds_per_face * face_index
-    for i in range(leds_per_face):
-        np[face_offset + i] = color
-
-
-def get_animations() -> dict[str, 'ModuleType']:
-    return {name: getattr(__import__(f'animations.{name}'), name) for name in ANIMATIONS}
+# Animation modules are imported once at boot instead of re-resolving (and
+# re-scanning the filesystem) on every run_animations start. Passing a
+# fromlist makes __import__ return the submodule itself rather than the
+# 'animations' package.
+ANIMATION_MODULES = {name: __import__(f'animations.{name}', None, None, (name,)) for name in ANIMATIONS}
 
 
 async def run_animations(
@@ -50,34 +31,59 @@ async def run_animations(
     ) -> None:
     temp_settings = TempratureSettings()
 
-    animations = get_animations()
-    async def start_animation(animation_name: str) -> None:
-        stop_event = asyncio.Event()
+    animations = ANIMATION_MODULES
+
+    # One stop event reused across switches; the outgoing task is cancelled
+    # and drained in the background, so no per-switch Event (or gather
+    # wrapper) allocation is needed.
+    stop_event = asyncio.Event()
+
+    async def _drain(old_task) -> None:
+        # Swallow the cancellation (and log anything else) off the switch path
+        try:
+            await old_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            sys.print_exception(e)
+
+    async def start_animation(animation_name: str):
+        stop_event.clear()
         temp_settings.set_values_to_default()
-        task = asyncio.create_task(animations[animation_name].animate(
+        return asyncio.create_task(animations[animation_name].animate(
             shape, stop_event, state
             ))
-        return task, stop_event
-    
-    if Path('force_animation.txt').exists():
-        force_animation = Path('force_animation.txt').read_text().strip()
+
+    try:
+        with open('force_animation.txt') as f:
+            force_animation = f.read().strip()
+    except OSError:
+        force_animation = None
+    if force_animation:
         print(f"Forcing animation: {force_animation}")
-        task, stop_event = await start_animation(force_animation)
-        await asyncio.gather(task)
+        task = await start_animation(force_animation)
+        await task
 
     current_animation = list(animations.keys())[0]
-    task, stop_event = await start_animation(current_animation)
+    task = await start_animation(current_animation)
     while True:
         try:
-            new_animation = (await state.get()).get('animation')
+            # Suspend until the wifi task publishes an animation instead of
+            # polling the state 20 times a second
+            await state.wait('animation')
+            # Plain attribute read; no state snapshot per wakeup
+            new_animation = state.animation
             if new_animation is not None:
                 if new_animation != current_animation and new_animation in animations:
                     current_animation = new_animation
                     if task is not None:
+                        # Cancel instead of waiting out the old animation's
+                        # frame sleep; the new one starts immediately while
+                        # _drain reaps the cancelled task.
                         stop_event.set()
-                        await asyncio.gather(task)
-                    task, stop_event = await start_animation(new_animation)
-            await asyncio.sleep(0.05)
+                        task.cancel()
+                        asyncio.create_task(_drain(task))
+                    task = await start_animation(new_animation)
         except Exception as e:
             sys.print_exception(e)
             error_animation(shape)
@@ -96,7 +102,7 @@ async def get_animation_name(state: SharedState):
             if not await is_wifi_connected():
                 await connect_to_wifi()
         else:
-            await state.update('animation', animation_name)
+            state.update('animation', animation_name)
             await asyncio.sleep(1)
 
 
@@ -104,10 +110,10 @@ def error_animation(shape: Shape) -> None:
     try:
         for i in range(3):
             for face in range(shape.num_faces):
-                shape.set_face_color(face, (255, 0, 0))
+                shape.set_face_color(face, ERROR_COLOR)
                 shape.write()
                 time.sleep(0.5)
-                shape.set_face_color(face, (0, 0, 0))
+                shape.set_face_color(face, OFF_COLOR)
                 shape.write()
                 time.sleep(0.5)
     except Exception as e:
@@ -129,23 +135,24 @@ def init_animation(shape: Shape) -> None:
                                               '.  \         /;;;'          `-_, :!;;;''    
                                                 "-_\_______/;;'                `-!'      
 """)
-    for i in range(3):
-        color = [0, 0, 0]
-        color[i] = 255
+    for color in INIT_COLORS:
         for face in range(shape.num_faces):
-            shape.set_face_color(face, tuple(color))
+            shape.set_face_color(face, color)
             shape.write()
         time.sleep(1)
 
 def main():
-    shape_name = Path('shape.txt').read_text().strip()
-    shape = Shape(Path(f'shapes/{shape_name}.json'))
+    with open('shape.txt') as f:
+        shape_name = f.read().strip()
+    shape = Shape(f'shapes/{shape_name}.json')
 
     init_animation(shape)
 
     initial_state = {
         'animation': None,
-        'distances': [(None, 0)] * 5
+        # Flat (distance, temp) pairs, distance -1 meaning "no reading";
+        # read_sensor overwrites this layout in place every tick
+        'distances': array('i', [-1, 0] * 5)
     }
 
     state = SharedState(initial_state)
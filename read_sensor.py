@@ -3,10 +3,11 @@ from machine import Pin, SoftI2C, Timer
 from VL53L0X import VL53L0X
 import asyncio
 import utime  # Add this for timing measurements
+from array import array
 from utils import SharedState
 from wifi_client import send_message # New import
+import wifi_consts
 import sys # Added for print_exception
-from collections import deque # New import
 
 
 class TempratureSettings:
@@ -36,22 +37,40 @@ DISTANCE_OFFSET = 50 # Default offset for distance calculation
 SENSOR_LOOP_DELAY_S = 0.1 # Corresponds to asyncio.sleep(0.1)
 # Calculate max history length based on window and loop delay
 MAX_TEMP_HISTORY_LENGTH = int(TEMP_HISTORY_WINDOW_MS / (SENSOR_LOOP_DELAY_S * 1000))
+# The monotonic min-queue ring needs one spare slot to distinguish full from empty
+_MIN_RING_SIZE = MAX_TEMP_HISTORY_LENGTH + 1
+
+# XSHUT GPIO numbers, one per sensor. All live in the GPIO0-31 bank, so the
+# whole bank can be driven through the ESP32 set/clear registers: a single
+# mem32 store to W1TS/W1TC flips any subset of the lines at once instead of
+# going through Pin.value per pin.
+_XSHUT_PINS = (23, 4, 15, 27, 25)
+_GPIO_OUT_W1TS = 0x3FF44008
+_GPIO_OUT_W1TC = 0x3FF4400C
+_XSHUT_MASK = sum(1 << pin for pin in _XSHUT_PINS)
+
+
+def _xshut_clear_all():
+    machine.mem32[_GPIO_OUT_W1TC] = _XSHUT_MASK
+
+
+def _xshut_set(sensor_index):
+    machine.mem32[_GPIO_OUT_W1TS] = 1 << _XSHUT_PINS[sensor_index]
+
+
+def _xshut_clear(sensor_index):
+    machine.mem32[_GPIO_OUT_W1TC] = 1 << _XSHUT_PINS[sensor_index]
 
 
 async def read_sensor(state: SharedState):
     print("setting up i2c")
     sda = Pin(21)
     scl = Pin(22)
-    Xshut0 = Pin(23, Pin.OUT, value=False)
-    Xshut1 = Pin(4, Pin.OUT, value=False)
-    Xshut2 = Pin(15, Pin.OUT, value=False)
-    Xshut3 = Pin(27, Pin.OUT, value=False)
-    Xshut4 = Pin(25, Pin.OUT, value=False)
-    Xshut3 = Pin(27, Pin.OUT, value=False)
-    Xshut4 = Pin(25, Pin.OUT, value=False)
     # THIS PIN IS INPUT ONLY FUCK YOU
     #Xshut4 = Pin (39, Pin.OUT,value=True)
-    pins = [Xshut0, Xshut1, Xshut2, Xshut3, Xshut4]
+    # Pin objects only set up the pads as outputs; the loop drives them
+    # through the W1TS/W1TC helpers above.
+    pins = [Pin(pin, Pin.OUT, value=False) for pin in _XSHUT_PINS]
     
     # Initialize sensor_temp_array with correct length
     sensor_temp_array = [0] * len(pins)
@@ -62,15 +81,14 @@ async def read_sensor(state: SharedState):
 
     # Function to shutdown all sensors
     async def xshutarrayreset():
-        for pin in pins:
-            pin.value(False)
+        _xshut_clear_all()  # one register write drops every XSHUT line
         await asyncio.sleep(0.05)  # Give time to shut down completely
 
     # Configure a single sensor
     async def configure_tof(sensor_index, address_already_set=False):
         # Activate only the requested sensor
         # Assumes all others are off or at different addresses due to prior xshutarrayreset and sequential config
-        pins[sensor_index].value(True)
+        _xshut_set(sensor_index)
         await asyncio.sleep(0.05)  # Give time for the sensor to power up and stabilize
 
         try:
@@ -93,11 +111,15 @@ async def read_sensor(state: SharedState):
             
             if not address_already_set:
                 tof.set_address(new_address)
+
+            # Start continuous back-to-back ranging so all sensors measure in
+            # parallel; the read loop then just harvests the latest results.
+            tof.start()
             print(f"Sensor {sensor_index} configured successfully at address {hex(new_address)}")
             return tof
         except Exception as e:
             print(f"Error configuring sensor {sensor_index}: {e}")
-            pins[sensor_index].value(False)  # Shut down the problematic sensor
+            _xshut_clear(sensor_index)  # Shut down the problematic sensor
             return None
 
     async def initialize_sensors(current_pins, current_i2c):
@@ -127,9 +149,25 @@ async def read_sensor(state: SharedState):
     last_init_time = utime.ticks_ms()  # Track when we last initialized sensors
     
 
-    # New state variables for temperature monitoring and lock message cooldown
-    # temp_history_per_sensor = [[] for _ in range(len(pins))] # Old list-based history
-    temp_history_per_sensor = [deque((), MAX_TEMP_HISTORY_LENGTH) for _ in range(len(pins))]
+    # New state variables for temperature monitoring and lock message cooldown.
+    # Per sensor, a monotonic min-queue over the last MAX_TEMP_HISTORY_LENGTH
+    # samples (the TEMP_HISTORY_WINDOW_MS window at the loop cadence): temps
+    # are strictly increasing from head to tail, so the head entry is always
+    # the window minimum and the rise check is O(1) per tick instead of a
+    # linear scan of the full history.
+    # All sensors share two flat arrays (sensor i owns the _MIN_RING_SIZE
+    # slots starting at i * _MIN_RING_SIZE) instead of a Python list of
+    # per-sensor arrays — one allocation each, no object headers per sensor.
+    min_sample_ring = array('i', [0] * (len(pins) * _MIN_RING_SIZE))
+    min_temp_ring = array('i', [0] * (len(pins) * _MIN_RING_SIZE))
+    min_head = array('i', [0] * len(pins))
+    min_tail = array('i', [0] * len(pins))  # one past the last valid entry
+    sample_no = 0
+
+    # Readings are published as one flat array of (distance, temp) pairs —
+    # sensor i owns slots 2*i / 2*i+1, distance -1 meaning "no reading" —
+    # overwritten in place each tick instead of rebuilding a list of tuples.
+    sensor_readings = array('i', [-1, 0] * len(pins))
 
     # Initialize last_lock_sent_time to be more than cooldown in the past to allow immediate sending
     _initial_current_time_for_lock_logic = utime.ticks_ms()
@@ -137,32 +175,38 @@ async def read_sensor(state: SharedState):
 
     temp_settings = TempratureSettings()
 
+    # Module attribute access is a dict probe per call on MicroPython; bind
+    # the timing helpers used inside the loop to locals once.
+    ticks_ms = utime.ticks_ms
+    ticks_diff = utime.ticks_diff
+
     while True:
-        current_loop_time = utime.ticks_ms()
+        current_loop_time = ticks_ms()
 
         # Check if we need to reinitialize sensors
-        if utime.ticks_diff(current_loop_time, last_init_time) >= REINIT_INTERVAL:
+        if ticks_diff(current_loop_time, last_init_time) >= REINIT_INTERVAL:
             print("\nReinitializing sensors...")
             tofs = await initialize_sensors(pins, i2c)
             last_init_time = current_loop_time
         
         # Measure how long the readings take
-        start_time_reading_block = utime.ticks_ms()
+        start_time_reading_block = ticks_ms()
         
-        sensor_readings = []
         for i, sensor_tof in enumerate(tofs): # Use enumerate for index
             if sensor_tof is not None:
                 try:
-                    distance = max(0, sensor_tof.ping() - DISTANCE_OFFSET) # Adjusted offset if necessary
+                    # Sensors range continuously, so this is just an I2C result
+                    # harvest; the 5 measurements overlap instead of running
+                    # serially as the old per-sensor ping() did.
+                    distance = max(0, sensor_tof.read() - DISTANCE_OFFSET) # Adjusted offset if necessary
                     # Update temperature based on distance
                     sensor_temp_array[i] = sensor_temp_array[i] + temp_settings.TEMP_DELTA_UP if distance < temp_settings.TEMPRATURE_CHANGE_THRESHOLD else sensor_temp_array[i] - temp_settings.TEMP_DELTA_DOWN
                     sensor_temp_array[i] = min(max(0, sensor_temp_array[i]), 255)
-                    # Create a tuple with distance and temperature
-                    sensor_readings.append((distance, sensor_temp_array[i]))
+                    sensor_readings[2 * i] = distance
                 except Exception as e:
-                    # Log error and record None for this sensor in this cycle
+                    # Log error and record "no reading" for this sensor in this cycle
                     print(f"Error reading from sensor {i} (expected addr {hex(0x33 + i)}): {e}")
-                    sensor_readings.append((None, sensor_temp_array[i])) # Append current temp before reinit
+                    sensor_readings[2 * i] = -1
                     print(f"Reinitializing all sensors due to read error on sensor {i}...")
                     tofs = await initialize_sensors(pins, i2c) # Reinitialize all sensors
                     last_init_time = current_loop_time # Consider this a reinitialization point
@@ -170,11 +214,12 @@ async def read_sensor(state: SharedState):
                     # For now, it will retry on the next cycle.
             else:
                 # Sensor was not configured or failed during configuration
-                sensor_readings.append((None, sensor_temp_array[i]))
+                sensor_readings[2 * i] = -1
+            sensor_readings[2 * i + 1] = sensor_temp_array[i]
         
         # Calculate elapsed time for readings block
-        end_time_reading_block = utime.ticks_ms()
-        elapsed_ms = utime.ticks_diff(end_time_reading_block, start_time_reading_block)
+        end_time_reading_block = ticks_ms()
+        elapsed_ms = ticks_diff(end_time_reading_block, start_time_reading_block)
         
         # Update statistics
         read_count += 1
@@ -191,42 +236,46 @@ async def read_sensor(state: SharedState):
         triggering_sensor_index = -1
         triggering_sensor_temp = -1
 
+        sample_no += 1
         for i in range(len(pins)): # Iterate through all sensor temperature slots
             current_temp_for_sensor = sensor_temp_array[i]
 
-            # Update history for sensor i
-            # history = temp_history_per_sensor[i] # No longer needed to get a mutable list reference
-            # history.append((current_loop_time, current_temp_for_sensor))
-            # Prune history: keep entries from the last TEMP_HISTORY_WINDOW_MS seconds
-            # temp_history_per_sensor[i] = [(t, temp) for t, temp in history if utime.ticks_diff(current_loop_time, t) <= TEMP_HISTORY_WINDOW_MS]
-            # With deque(maxlen=...), appending handles pruning automatically.
-            temp_history_per_sensor[i].append((current_loop_time, current_temp_for_sensor))
-
-            # Check for temperature rise for sensor i
-            for recorded_time, recorded_temp in temp_history_per_sensor[i]: # Iterating deque is fine
-                # Check if current temp is >TEMP_RISE_THRESHOLD higher than any recorded temp in the window
-                if current_temp_for_sensor - recorded_temp > TEMP_RISE_THRESHOLD:
-                    lock_animation_triggered_this_cycle = True
-                    triggering_sensor_index = i
-                    triggering_sensor_temp = current_temp_for_sensor
-                    break  # Found a rise for this sensor, no need to check its further history
-            
-            if lock_animation_triggered_this_cycle:
+            base = i * _MIN_RING_SIZE
+            head = min_head[i]
+            tail = min_tail[i]
+            # Drop minima that fell out of the sample window
+            while head != tail and min_sample_ring[base + head] <= sample_no - MAX_TEMP_HISTORY_LENGTH:
+                head = (head + 1) % _MIN_RING_SIZE
+            # Drop entries >= the new temp; they can never be the window minimum again
+            while head != tail and min_temp_ring[base + (tail - 1) % _MIN_RING_SIZE] >= current_temp_for_sensor:
+                tail = (tail - 1) % _MIN_RING_SIZE
+            min_sample_ring[base + tail] = sample_no
+            min_temp_ring[base + tail] = current_temp_for_sensor
+            tail = (tail + 1) % _MIN_RING_SIZE
+            min_head[i] = head
+            min_tail[i] = tail
+
+            # Check if current temp is >TEMP_RISE_THRESHOLD higher than the
+            # lowest recorded temp in the window (the queue head)
+            if current_temp_for_sensor - min_temp_ring[base + head] > TEMP_RISE_THRESHOLD:
+                lock_animation_triggered_this_cycle = True
+                triggering_sensor_index = i
+                triggering_sensor_temp = current_temp_for_sensor
                 break # Found a rise in one sensor, proceed to check cooldown and send
 
         if lock_animation_triggered_this_cycle:
             # Check cooldown: more than LOCK_MESSAGE_COOLDOWN_MS ms since last "LOCK_ANIMATION"
-            if utime.ticks_diff(current_loop_time, last_lock_sent_time) > LOCK_MESSAGE_COOLDOWN_MS:
+            if ticks_diff(current_loop_time, last_lock_sent_time) > LOCK_MESSAGE_COOLDOWN_MS:
                 print(f"Sensor temperature spike detected (sensor {triggering_sensor_index}, current temp {triggering_sensor_temp}). Sending LOCK_ANIMATION.")
                 try:
-                    response = await send_message(b"LOCK_ANIMATION", False)
+                    response = await send_message(wifi_consts.OP_LOCK_ANIMATION, False)
                     print(f"LOCK_ANIMATION message sent successfully. Response: {response}")
                 except Exception as e_send:
                     print("Exception occurred while sending LOCK_ANIMATION message:")
                     sys.print_exception(e_send) # Requires 'import sys'
                 
                 last_lock_sent_time = current_loop_time # Update time of last sent message (or attempt)
-        await state.update("distances", sensor_readings)
+        state.update("distances", sensor_readings)
         #print(f"\rDistances: {sensor_readings} Time: {avg_read_time}ms", end="")
         await asyncio.sleep(SENSOR_LOOP_DELAY_S)
 
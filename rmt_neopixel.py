@@ -0,0 +1,59 @@
+import esp32
+import micropython
+from neopixel import NeoPixel
+
+# RMT at 80MHz / clock_div 8 gives 100ns ticks; WS2812B bit timings in ticks.
+_CLOCK_DIV = 8
+_T0H = 4   # 400ns
+_T0L = 8   # 800ns
+_T1H = 8   # 800ns
+_T1L = 4   # 400ns
+
+
+def _build_byte_table():
+    # 16 high/low durations per byte value, precomputed once so write() is a
+    # straight table copy per byte instead of 8 bit tests. Tuples of ints,
+    # not arrays: RMT.write_pulses only accepts lists and tuples.
+    table = []
+    for value in range(256):
+        durations = []
+        for bit in range(8):
+            if value & (0x80 >> bit):
+                durations += [_T1H, _T1L]
+            else:
+                durations += [_T0H, _T0L]
+        table.append(tuple(durations))
+    return tuple(table)
+
+
+_BYTE_PULSES = _build_byte_table()
+
+
+class RMTNeoPixel(NeoPixel):
+    """NeoPixel with write() offloaded to the ESP32 RMT peripheral.
+
+    The stock driver bit-bangs WS2812 timing on the CPU with interrupts
+    disabled, which costs ~1.2ms per frame for the full strip and skews
+    utime ticks. Here write() just translates buf into a pulse-duration
+    stream and hands it to the RMT, which clocks it out in the background.
+    The buf layout (and all indexing/fill behaviour) is inherited unchanged.
+    """
+
+    def __init__(self, pin, n, bpp=3, timing=1, rmt_channel=0):
+        super().__init__(pin, n, bpp, timing)
+        self._rmt = esp32.RMT(rmt_channel, pin=pin, clock_div=_CLOCK_DIV)
+        # Reused every frame: two durations per bit, 8 bits per byte. A list
+        # rather than an array so it can be passed to write_pulses directly.
+        self._pulses = [0] * (16 * n * bpp)
+
+    @micropython.native
+    def write(self):
+        pulses = self._pulses
+        byte_pulses = _BYTE_PULSES
+        pos = 0
+        for b in self.buf:
+            pulses[pos:pos + 16] = byte_pulses[b]
+            pos += 16
+        # Starts high and returns once the stream is handed to the RMT; the
+        # inter-frame gap is far longer than the WS2812 latch time.
+        self._rmt.write_pulses(pulses, 1)
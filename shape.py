@@ -1,35 +1,201 @@
-from pathlib import Path
+import array
+import binascii
 import json
+import micropython
+import ustruct
 from typing import Tuple, List
 import neopixel
 import machine
+from micropython import const
+from rmt_neopixel import RMTNeoPixel
 
-SHAPE_LED_PIN = 18
-SMALL_SHAPE_LED_PIN = 13
-SMALL_SHAPE_LED_COUNT = 2
+# const() + leading underscore lets the compiler inline these as immediates
+# instead of module-dict lookups
+_SHAPE_LED_PIN = const(18)
+_SMALL_SHAPE_LED_PIN = const(13)
+_SMALL_SHAPE_LED_COUNT = const(2)
+# Animations cycle through a handful of colors, so a tiny cache of pre-built
+# per-face byte patterns covers nearly all set_face_color calls.
+_PATTERN_CACHE_SIZE = const(8)
+# Bumped whenever the cache file layout changes, so stale files from older
+# firmware are rebuilt instead of misparsed.
+_CACHE_VERSION = const(3)
+
+
+def _write_groups(f, groups) -> None:
+    """Serialize a sequence of uint16 index sequences as count-prefixed records."""
+    f.write(ustruct.pack('<H', len(groups)))
+    for group in groups:
+        f.write(ustruct.pack('<H%dH' % len(group), len(group), *group))
+
+
+def _read_groups(f) -> Tuple[Tuple[int, ...], ...]:
+    """Inverse of _write_groups."""
+    (count,) = ustruct.unpack('<H', f.read(2))
+    groups = []
+    for _ in range(count):
+        (length,) = ustruct.unpack('<H', f.read(2))
+        groups.append(ustruct.unpack('<%dH' % length, f.read(2 * length)) if length else ())
+    return tuple(groups)
 
 
 class Shape:
-    def __init__(self, file_path: Path):
-        self.name = file_path.stem  # Gets filename without extension
-        data = json.loads(file_path.read_text())
-        
+    def __init__(self, file_path: str):
+        # Filename without directory or extension; pathlib is a pure-Python
+        # shim on MicroPython, so paths stay plain strings throughout.
+        self.name = file_path.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+        cache_path = file_path.rsplit('.', 1)[0] + '.cache'
+        # The cache header records a checksum of the JSON it was built from;
+        # mtimes can't be trusted across boots (the RTC restarts at the 2000
+        # epoch on every power cycle) and hand-edits often preserve the file
+        # size, so a redeployed JSON is detected by its content changing.
+        checksum = self._source_checksum(file_path)
+        loaded = False
+        try:
+            self._load_cache(cache_path, checksum)
+            loaded = True
+        except Exception:
+            # Missing, truncated, stale or older-format cache: rebuild below
+            pass
+        if not loaded:
+            self._build_from_json(file_path)
+            self._write_cache(cache_path, checksum)
+
+        # Derived once per boot; fixed for the lifetime of the device
+        self.num_leds = self.leds_per_face * self.num_faces
+
+        # Main strip goes through the RMT so write() doesn't stall the CPU;
+        # the two status LEDs are too short to be worth an RMT channel.
+        self.np = RMTNeoPixel(machine.Pin(_SHAPE_LED_PIN, machine.Pin.OUT), self.num_leds)
+        self.small_np = neopixel.NeoPixel(machine.Pin(_SMALL_SHAPE_LED_PIN, machine.Pin.OUT), _SMALL_SHAPE_LED_COUNT)
+        # The raw LED buffer and pixel width never change; cached here so the
+        # hot paths skip the np attribute hop
+        self._buf = self.np.buf
+        self._bpp = self.np.bpp
+        self._order = self.np.ORDER
+        self._small_buf = self.small_np.buf
+        # Byte offset of each face's first LED, so per-call multiplies become
+        # a single indexed load
+        self._face_byte_offset = tuple(self.leds_per_face * i * self._bpp for i in range(self.num_faces))
+        self._color_patterns = {}
+
+    def _build_from_json(self, file_path: str) -> None:
+        with open(file_path) as f:
+            data = json.load(f)
+
         self.leds_per_face = data.get('led_per_face')
         faces_data = data.get('faces')
         sensors = data.get('sensors')
-        
+
         if self.leds_per_face is None or faces_data is None:
             raise ValueError(f"Invalid shape data in {file_path}")
-            
+
         self.num_faces = len(faces_data)
-        self.layers = self._get_layers(faces_data)
-        self.sensors_to_face = [[face for face in range(len(faces_data)) if i in faces_data[face]['sensors']] for i in range(sensors)]
-        self.face_to_sensors = [face['sensors'] for face in faces_data]
+        self._install_layers(self._build_csr(self._get_layers(faces_data)))
+        self._build_sensor_maps(faces_data, sensors)
         self.face_positions = [face['pos'] for face in faces_data]
-        
-        # Initialize NeoPixel
-        self.np = neopixel.NeoPixel(machine.Pin(SHAPE_LED_PIN, machine.Pin.OUT), self.leds_per_face * self.num_faces)
-        self.small_np = neopixel.NeoPixel(machine.Pin(SMALL_SHAPE_LED_PIN, machine.Pin.OUT), SMALL_SHAPE_LED_COUNT)
+
+    @staticmethod
+    def _build_csr(groups) -> Tuple[array.array, array.array]:
+        """Pack a sequence of uint16 index sequences into CSR indptr/indices arrays."""
+        indptr = array.array('H', bytes(2 * (len(groups) + 1)))
+        total = 0
+        for i, group in enumerate(groups):
+            total += len(group)
+            indptr[i + 1] = total
+        indices = array.array('H', bytes(2 * total))
+        pos = 0
+        for group in groups:
+            for idx in group:
+                indices[pos] = idx
+                pos += 1
+        return indptr, indices
+
+    @staticmethod
+    def _csr_views(indptr: array.array, indices: array.array) -> Tuple[memoryview, ...]:
+        """One zero-copy memoryview per CSR group, indexable like the old lists."""
+        mv = memoryview(indices)
+        return tuple(mv[indptr[i]:indptr[i + 1]] for i in range(len(indptr) - 1))
+
+    def _build_sensor_maps(self, faces_data: List[dict], sensors: int) -> None:
+        # face -> sensors comes straight from the JSON; sensor -> faces is its
+        # inverse, built with one counting pass instead of scanning every face
+        # per sensor.
+        counts = array.array('H', bytes(2 * sensors))
+        for face in faces_data:
+            for s in face['sensors']:
+                counts[s] += 1
+        s2f_indptr = array.array('H', bytes(2 * (sensors + 1)))
+        for i in range(sensors):
+            s2f_indptr[i + 1] = s2f_indptr[i] + counts[i]
+        s2f_indices = array.array('H', bytes(2 * s2f_indptr[sensors]))
+        fill = array.array('H', s2f_indptr[:sensors])
+        for face_idx, face in enumerate(faces_data):
+            for s in face['sensors']:
+                s2f_indices[fill[s]] = face_idx
+                fill[s] += 1
+
+        self._install_sensor_maps(
+            (s2f_indptr, s2f_indices),
+            self._build_csr([face['sensors'] for face in faces_data]),
+        )
+
+    def _install_layers(self, csr: Tuple[array.array, array.array]) -> None:
+        # Same flat CSR storage as the sensor maps; each layer is a zero-copy
+        # view that still supports len/iteration/indexing/'in' like the old
+        # tuples did.
+        self._layers_indptr, self._layers_indices = csr
+        self.layers = self._csr_views(self._layers_indptr, self._layers_indices)
+
+    def _install_sensor_maps(self, s2f: Tuple[array.array, array.array], f2s: Tuple[array.array, array.array]) -> None:
+        self._s2f_indptr, self._s2f_indices = s2f
+        self._f2s_indptr, self._f2s_indices = f2s
+        self.sensors_to_face = self._csr_views(self._s2f_indptr, self._s2f_indices)
+        self.face_to_sensors = self._csr_views(self._f2s_indptr, self._f2s_indices)
+
+    @staticmethod
+    def _source_checksum(file_path: str) -> int:
+        """CRC32 of a file, read in small chunks.
+
+        One linear read of a few-KB JSON at boot; same-size edits (a tweaked
+        pos digit, a swapped sensor index) still change the CRC.
+        """
+        crc = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(256)
+                if not chunk:
+                    break
+                crc = binascii.crc32(chunk, crc)
+        return crc & 0xFFFFFFFF
+
+    def _write_cache(self, cache_path: str, source_checksum: int) -> None:
+        """Serialize the derived shape data so later boots skip the JSON parse."""
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(ustruct.pack('<BI2H', _CACHE_VERSION, source_checksum, self.leds_per_face, self.num_faces))
+                _write_groups(f, self.layers)
+                _write_groups(f, self.sensors_to_face)
+                _write_groups(f, self.face_to_sensors)
+                for pos in self.face_positions:
+                    f.write(ustruct.pack('<3f', pos[0], pos[1], pos[2]))
+        except OSError:
+            # Read-only or full filesystem: keep booting from JSON
+            pass
+
+    def _load_cache(self, cache_path: str, source_checksum: int) -> None:
+        with open(cache_path, 'rb') as f:
+            version, cached_checksum, self.leds_per_face, self.num_faces = ustruct.unpack('<BI2H', f.read(9))
+            if version != _CACHE_VERSION:
+                raise ValueError("shape cache version mismatch")
+            if cached_checksum != source_checksum:
+                raise ValueError("shape cache built from a different JSON")
+            self._install_layers(self._build_csr(_read_groups(f)))
+            self._install_sensor_maps(
+                self._build_csr(_read_groups(f)),
+                self._build_csr(_read_groups(f)),
+            )
+            self.face_positions = [list(ustruct.unpack('<3f', f.read(12))) for _ in range(self.num_faces)]
 
     def _get_layers(self, shape_faces: List[dict]) -> Tuple[Tuple[int, ...], ...]:
         if not shape_faces:
@@ -45,46 +211,93 @@ class Shape:
             processed_layers.append(tuple(item[0] for item in layer_list))
         return tuple(processed_layers)
 
+    def _face_pattern(self, color: Tuple[int, int, int]) -> bytes:
+        """Return the raw byte pattern for a whole face of the given color."""
+        pattern = self._color_patterns.get(color)
+        if pattern is None:
+            bpp = self._bpp
+            order = self._order
+            pixel = bytearray(bpp)
+            for i in range(bpp):
+                pixel[order[i]] = color[i]
+            pattern = bytes(pixel) * self.leds_per_face
+            if len(self._color_patterns) >= _PATTERN_CACHE_SIZE:
+                # Dropping the whole cache is cheaper than tracking LRU order
+                self._color_patterns.clear()
+            self._color_patterns[color] = pattern
+        return pattern
+
+    # The per-frame methods below run under the native emitter; they are
+    # plain integer/bytearray code, exactly what it speeds up. The byte
+    # stores themselves are already single C-level slice operations, so the
+    # viper emitter (with its pointer-typed locals) would buy nothing more.
+    @micropython.native
     def set_face_color(self, face_index: int, color: Tuple[int, int, int]) -> None:
-        """Set all LEDs in a face to a specific color."""
-        face_offset = self.leds_per_face * face_index
-        for i in range(self.leds_per_face):
-            self[face_offset + i] = color
+        """Set all LEDs in a face to a specific color with one buffer slice store."""
+        pattern = self._face_pattern(color)
+        start = self._face_byte_offset[face_index]
+        self._buf[start:start + len(pattern)] = pattern
             
+    @micropython.native
     def write(self) -> None:
         """Write the LED buffer to the physical LEDs."""
         self.np.write()
         
         
+        # Sample the first LED of each layer-0 face straight from the raw
+        # buffer (GRB order) rather than building tuples through __getitem__
+        buf = self._buf
+        face_offset = self._face_byte_offset
         if self.name == "octahedron":
             #  This should work for any shape but the esp32 is slow so we only do it for octahedron
-            colors = []
-            for face_index in self.layers[0]:
-                colors.append(self[self.leds_per_face * face_index])
-            color = [0, 0, 0]
-            for i in range(len(colors)):
-                color[0] += colors[i][0]
-                color[1] += colors[i][1]
-                color[2] += colors[i][2]
-            color[0] = color[0] // len(colors)
-            color[1] = color[1] // len(colors)
-            color[2] = color[2] // len(colors)
-            color = tuple(color)
+            faces = self.layers[0]
+            r = g = b = 0
+            for face_index in faces:
+                off = face_offset[face_index]
+                g += buf[off]
+                r += buf[off + 1]
+                b += buf[off + 2]
+            n = len(faces)
+            color = (r // n, g // n, b // n)
         else:
-            color = self[self.leds_per_face * self.layers[0][0]]
+            off = face_offset[self.layers[0][0]]
+            color = (buf[off + 1], buf[off], buf[off + 2])
             
-        self.small_np.fill(color)
+        # Both status pixels take the same color; six direct byte stores
+        # (GRB) beat the driver's per-LED fill loop for a fixed 2-LED strip
+        sbuf = self._small_buf
+        sbuf[0] = sbuf[3] = color[1]
+        sbuf[1] = sbuf[4] = color[0]
+        sbuf[2] = sbuf[5] = color[2]
         self.small_np.write()
         
+    @micropython.native
     def __getitem__(self, index: int) -> Tuple[int, int, int]:
         """Get the color of an LED at the specified index."""
-        return self.np[index]
-        
+        # Straight to the cached buffer: one Python frame instead of
+        # Shape.__getitem__ -> np attribute -> NeoPixel.__getitem__
+        off = index * self._bpp
+        buf = self._buf
+        order = self._order
+        return tuple(buf[off + order[i]] for i in range(self._bpp))
+
+    @micropython.native
     def __setitem__(self, index: int, color: Tuple[int, int, int]) -> None:
         """Set the color of an LED at the specified index."""
-        self.np[index] = color
+        off = index * self._bpp
+        buf = self._buf
+        order = self._order
+        for i in range(len(color)):
+            buf[off + order[i]] = color[i]
         
+    @micropython.native
     def fill(self, color: Tuple[int, int, int]) -> None:
         """Fill all LEDs with the specified color."""
-        self.np.fill(color) 
+        # Replicate the cached face pattern with slice stores instead of the
+        # driver's per-LED Python loop
+        pattern = self._face_pattern(color)
+        buf = self._buf
+        step = len(pattern)
+        for start in range(0, len(buf), step):
+            buf[start:start + step] = pattern
         self.small_np.fill(color)
\ No newline at end of file
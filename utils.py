@@ -1,29 +1,93 @@
 import asyncio
-from copy import deepcopy
+import json
 from typing import Optional, Dict, Any, Callable
 
 class SharedState:
+    """Mutable key/value state shared between tasks.
+
+    Assumes callers don't share mutable substructures in `initial`: the
+    dict itself is copied, its values are not.
+    """
+
     def __init__(self, initial: Optional[Dict[Any, Any]] = None):
-        self._data: Optional[Dict[Any, Any]] = deepcopy(initial) if initial is not None else {}
+        self._data: Optional[Dict[Any, Any]] = dict(initial) if initial is not None else {}
+        self._events: Dict[Any, asyncio.Event] = {}
+        self._encoded: Optional[bytes] = None
+
+    @property
+    def animation(self) -> Optional[str]:
+        """Current animation name, read without snapshotting the dict.
+
+        A single dict load is atomic between awaits, so readers on the
+        hot path can use this instead of copying the whole state.
+        """
+        return self._data.get('animation')
 
-    async def get_unsafe(self) -> Optional[Dict[Any, Any]]:
+    @animation.setter
+    def animation(self, value: Optional[str]) -> None:
+        self._data['animation'] = value
+        self._encoded = None
+
+    def get_unsafe(self) -> Optional[Dict[Any, Any]]:
         return self._data
-    
+
     async def get(self) -> Optional[Dict[Any, Any]]:
-        return deepcopy(self._data)
+        # Values are scalars or buffers updated in place, so a shallow
+        # snapshot of the dict is all callers need; deepcopy walked the
+        # whole structure per call.
+        return dict(self._data)
+
+    async def wait(self, key: str) -> None:
+        """Suspend until the next update() of the given key."""
+        event = self._events.get(key)
+        if event is None:
+            event = self._events[key] = asyncio.Event()
+        await event.wait()
+        event.clear()
+
+    def get_encoded(self) -> bytes:
+        """Null-terminated UTF-8 JSON encoding of the state.
 
-    async def update(self, key: str, value: Any) -> None:
-        if self._data is None:
-            self._data = {}
+        Re-encoded only after updates; the protocol terminator is baked in
+        so serving a request is a single write of this object.
+        """
+        if self._encoded is None:
+            self._encoded = json.dumps(self._data).encode('utf-8') + b'\x00'
+        return self._encoded
+
+    # update and the getters above never await; keeping them plain functions
+    # skips a coroutine allocation and scheduler round-trip per call.
+    def update(self, key: str, value: Any) -> None:
         self._data[key] = value
+        self._encoded = None
+        event = self._events.get(key)
+        if event is not None:
+            event.set()
 
 
-async def read_until_null_terminator(reader):
-    buffer = bytearray()
-    while True:
-        byte = await reader.read(1)  # Reads 1 byte, returns a bytes object like b'\x00' or b'a'
+# Bytes received past a message's terminator, kept per reader until its next
+# read_until_null_terminator call. Keyed by id(reader); callers must call
+# discard_read_tail when they close the stream.
+_read_tails = {}
 
-        if byte == b'\x00':
-            return bytes(buffer)
 
-        buffer.append(byte[0])
+def discard_read_tail(reader) -> None:
+    """Forget any buffered bytes for a reader that is being closed."""
+    _read_tails.pop(id(reader), None)
+
+
+async def read_until_null_terminator(reader):
+    # One read(256) per burst instead of one await per byte; the scheduler
+    # round-trips dominated the old loop even for short commands.
+    buffer = _read_tails.pop(id(reader), b'')
+    idx = buffer.find(b'\x00')
+    while idx < 0:
+        chunk = await reader.read(256)
+        if not chunk:
+            # EOF before a terminator: hand back what arrived
+            return bytes(buffer)
+        buffer += chunk
+        idx = buffer.find(b'\x00', len(buffer) - len(chunk))
+    if idx + 1 < len(buffer):
+        _read_tails[id(reader)] = buffer[idx + 1:]
+    return bytes(buffer[:idx])
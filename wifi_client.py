@@ -4,7 +4,7 @@ import time
 import uasyncio
 import sys
 
-from utils import read_until_null_terminator
+from utils import read_until_null_terminator, discard_read_tail
 import wifi_consts
 import json
 
@@ -85,7 +85,8 @@ async def connect_to_wifi():
         return False
 
 
-async def send_message(message: bytes, json_response: bool = True) -> dict | None:
+async def send_message(opcode: bytes, json_response: bool = True) -> dict | None:
+    """Send a 1-byte opcode request (see wifi_consts.OP_*) to the AP."""
     reader = None
     writer = None
     try:
@@ -93,9 +94,8 @@ async def send_message(message: bytes, json_response: bool = True) -> dict | Non
             uasyncio.open_connection(wifi_consts.ACCESS_POINT_IP_ADDRESS, wifi_consts.PORT),
             timeout=10.0
         )
-        
-        request_message = message + b"\x00"
-        writer.write(request_message)
+
+        writer.write(opcode)
         await writer.drain()
         raw_data = await uasyncio.wait_for(
             read_until_null_terminator(reader),
@@ -108,7 +108,7 @@ async def send_message(message: bytes, json_response: bool = True) -> dict | Non
         if not raw_data:
             return None
         elif raw_data == b"UNKNOWN_REQUEST":
-            print(f"Unknown request: {message}")
+            print(f"Unknown request opcode: {opcode}")
             return None
         
         if not json_response:
@@ -137,6 +137,8 @@ async def send_message(message: bytes, json_response: bool = True) -> dict | Non
         sys.print_exception(e)
         return None
     finally:
+        if reader:
+            discard_read_tail(reader)
         if writer:
             writer.close()
             await writer.wait_closed()
@@ -144,7 +146,7 @@ async def send_message(message: bytes, json_response: bool = True) -> dict | Non
 
 async def fetch_animation_data() -> str | None:
     """Fetches animation data from AP socket asynchronously. Assumes Wi-Fi is connected."""
-    data = await send_message(b"GET_ANIMATION")
+    data = await send_message(wifi_consts.OP_GET_ANIMATION)
     if data is not None:
         animation_name = data.get('animation')
         print(f"Received animation: {animation_name}")
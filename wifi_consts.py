@@ -6,4 +6,9 @@ SUBNET_MASK = "255.255.255.0"
 GATEWAY = "10.0.0.1" # Typically same as IP for AP mode
 
 # Server configuration
-PORT = 1000 
\ No newline at end of file
+PORT = 1000
+
+# Protocol opcodes: every request is a single byte, dispatched by index on
+# the server. Responses are still null-terminated.
+OP_GET_ANIMATION = b"\x01"
+OP_LOCK_ANIMATION = b"\x02" 
\ No newline at end of file
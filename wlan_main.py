@@ -1,49 +1,69 @@
 import sys
-import json
 from animations import ANIMATIONS
 import network
 import usocket
 import uasyncio
 import random
 import time
-from utils import SharedState, read_until_null_terminator
+from utils import SharedState
 import wifi_consts
 
 
 TIME_BETWEEN_ANIMATIONS_SECONDS = 60
 LOCK_WINDOW_SECONDS = 10
 MAX_LOCK_TIME_SECONDS = 60
+# Lock timing runs on the ticks_ms clock, which is cheaper to read than
+# time.time and monotonic by construction
+LOCK_WINDOW_MS = LOCK_WINDOW_SECONDS * 1000
+MAX_ANIMATION_TIME_MS = (TIME_BETWEEN_ANIMATIONS_SECONDS + MAX_LOCK_TIME_SECONDS) * 1000
 
 HOST_IP = wifi_consts.ACCESS_POINT_IP_ADDRESS # Listen on the AP's IP address
 
 REQUEST_READ_TIMEOUT_S = 10.0
 ACK_READ_TIMEOUT_S = 5.0
 
+# Shared scratch buffer for the 3-byte client ACK. Its contents are never
+# inspected, so concurrent handlers interleaving into it is harmless; sharing
+# it keeps the ACK read allocation-free.
+_ACK_BUF = bytearray(3)
+_ACK_MV = memoryview(_ACK_BUF)
+
+
+async def _read_ack(reader) -> int:
+    """Fill the ACK buffer via readinto; returns how many bytes arrived."""
+    n = 0
+    while n < len(_ACK_BUF):
+        count = await reader.readinto(_ACK_MV if n == 0 else _ACK_MV[n:])
+        if not count:
+            break
+        n += count
+    return n
 
 
-async def provide_animation(reader: usocket.socket, writer: usocket.socket, state: SharedState):
-    current_shared_state = await state.get_unsafe()
-    response_payload = json.dumps(current_shared_state)
 
-    writer.write(response_payload.encode('utf-8') + b'\x00')
+async def provide_animation(reader: usocket.socket, writer: usocket.socket, state: SharedState):
+    # The state only changes when choose_animation/lock_animation update it,
+    # so the encoded payload comes from SharedState's cache instead of
+    # re-serializing per request
+    writer.write(state.get_encoded())
     await writer.drain()
 
 
 async def lock_animation(reader: usocket.socket, writer: usocket.socket, state: SharedState):
-    state.update('last_locked_animation', time.time())
+    state.update('last_locked_animation', time.ticks_ms())
     writer.write(b"LOCKED\x00")
     await writer.drain()
 
 
-RESPONSES = {
-    b"GET_ANIMATION": provide_animation,
-    b"LOCK_ANIMATION": lock_animation
-}
+# Handler per opcode, indexed by the request byte (see wifi_consts.OP_*);
+# slot 0 is unused so the opcodes stay nonzero on the wire
+_HANDLERS = (None, provide_animation, lock_animation)
+
 
 async def handle_client(reader, writer, state: SharedState):
     """
     Handles incoming client connections.
-    Reads a request (ending with null terminator), sends a JSON response (ending with null terminator),
+    Reads a 1-byte opcode request, sends a null-terminated response,
     and expects an ACK.
     """
 
@@ -52,21 +72,26 @@ async def handle_client(reader, writer, state: SharedState):
     print(f"Client connected: {client_addr}")
     try:
         request = await uasyncio.wait_for(
-            read_until_null_terminator(reader),
+            reader.readexactly(1),
             timeout=REQUEST_READ_TIMEOUT_S
         )
         if not request:
             return
-        
-        if request in RESPONSES:
-            await RESPONSES[request](reader, writer, state)
+
+        # Single indexed load instead of parsing a terminated command string
+        opcode = request[0]
+        handler = _HANDLERS[opcode] if opcode < len(_HANDLERS) else None
+        if handler is not None:
+            await handler(reader, writer, state)
         else:
-            print(f"Unknown request: {request}")
+            print(f"Unknown request opcode: {opcode}")
             writer.write(b"UNKNOWN_REQUEST\x00")
             await writer.drain()
 
-        # 4. Wait for ACK from client
-        ack = await uasyncio.wait_for(reader.read(3), timeout=ACK_READ_TIMEOUT_S) # Expect "ACK" (3 bytes)
+        # 4. Wait for ACK from client; _read_ack keeps collecting until all
+        # 3 bytes arrive (no short TCP fragments) without allocating a fresh
+        # bytes object per request
+        await uasyncio.wait_for(_read_ack(reader), timeout=ACK_READ_TIMEOUT_S)
 
     except uasyncio.TimeoutError as te:
         sys.print_exception(te) # Provide traceback for timeout
@@ -106,8 +131,9 @@ async def start_ap(state: SharedState):
             wifi_consts.PORT
         )
         print(f"Server started on {HOST_IP}:{wifi_consts.PORT}")
-        while True:
-            await uasyncio.sleep(10) # Keep the event loop alive
+        # Keep this task alive without periodic wakeups: the event is never
+        # set, so the task suspends here until cancelled
+        await uasyncio.Event().wait()
     except Exception as e:
         pass
     finally:
@@ -120,20 +146,38 @@ async def start_ap(state: SharedState):
 async def choose_animation(state: SharedState):
     animation = None
     while True:
-        animation_start_time = time.time()
+        animation_start_ticks = time.ticks_ms()
         new_animation = random.choice(ANIMATIONS)
         while new_animation == animation:
             new_animation = random.choice(ANIMATIONS)
         animation = new_animation
-        await state.update('animation', animation)
+        state.update('animation', animation)
         await uasyncio.sleep(TIME_BETWEEN_ANIMATIONS_SECONDS)
-        last_locked_animation = (await state.get_unsafe()).get('last_locked_animation')
+        last_locked_animation = state.get_unsafe().get('last_locked_animation')
         if last_locked_animation is not None:
-            while (time.time() - last_locked_animation < LOCK_WINDOW_SECONDS and
-                   time.time() - animation_start_time < TIME_BETWEEN_ANIMATIONS_SECONDS + MAX_LOCK_TIME_SECONDS):
-                await uasyncio.sleep(1)
-                last_locked_animation = (await state.get_unsafe()).get('last_locked_animation')
-        
+            # Sleep for exactly the remaining lock window (capped by the hard
+            # animation limit), waking early only when a fresh lock lands —
+            # one wakeup per lock instead of a 1-second poll
+            while True:
+                # One clock read per check instead of two
+                now = time.ticks_ms()
+                remaining = min(
+                    LOCK_WINDOW_MS - time.ticks_diff(now, last_locked_animation),
+                    MAX_ANIMATION_TIME_MS - time.ticks_diff(now, animation_start_ticks),
+                )
+                if remaining <= 0:
+                    break
+                try:
+                    await uasyncio.wait_for_ms(state.wait('last_locked_animation'), remaining)
+                except uasyncio.TimeoutError:
+                    continue  # window expired; the recheck above exits
+                last_locked_animation = state.get_unsafe().get('last_locked_animation')
+            # Consume the lock: ticks_diff only covers spans under ~6.2 days,
+            # so a stale timestamp re-compared weeks later would wrap negative
+            # and stall every rotation. No await separates the recheck from
+            # here, so a concurrent lock can't be dropped.
+            state.update('last_locked_animation', None)
+
 
 def main():
     try: